@@ -1,18 +1,14 @@
 """Main Script for FPL Stats."""
 
-from typing import Dict, List
+from typing import Dict, Tuple
 
 import httpx
 import numpy as np
+import orjson
 import pandas as pd
 import streamlit as st
 from models import (
-    Event,
-    Player,
-    Team,
-    Position,
     PositionList,
-    PlayerList,
     EventList,
     TeamList,
 )
@@ -26,6 +22,109 @@ STATIC_DATA_URL = BASE_URL + "/bootstrap-static/"
 LDN_TIMEZONE = pytz.timezone("Europe/London")
 HK_TIMEZONE = pytz.timezone("Asia/Hong_Kong")
 
+PLAYER_FIELDS = [
+    "web_name",
+    "element_type",
+    "team",
+    "status",
+    "in_dreamteam",
+    "dreamteam_count",
+    "ep_this",
+    "ep_next",
+    "now_cost",
+    "ict_index",
+    "influence",
+    "creativity",
+    "threat",
+    "selected_by_percent",
+    "points_per_game",
+    "form",
+    "cost_change_event",
+    "cost_change_start",
+]
+# Compact dtypes applied once at load, which also parses the decimals FPL
+# serialises as strings. now_cost stays an integer and Price is derived from
+# it in float64, as it is compared against the slider bounds. The
+# low-cardinality columns filtered on every rerun are categorical, so `isin`
+# compares small integer codes instead of hashing strings.
+PLAYER_FIELD_DTYPES = {
+    "element_type": "category",
+    "team": "category",
+    "status": "category",
+    "dreamteam_count": np.int16,
+    "ep_this": np.float32,
+    "ep_next": np.float32,
+    "now_cost": np.int16,
+    "ict_index": np.float32,
+    "influence": np.float32,
+    "creativity": np.float32,
+    "threat": np.float32,
+    "selected_by_percent": np.float32,
+    "points_per_game": np.float32,
+    "form": np.float32,
+    "cost_change_event": np.int8,
+    "cost_change_start": np.int16,
+}
+PLAYER_COLUMN_RENAME_MAPPING = {
+    "web_name": "Name",
+    "element_type": "POS",
+    "team": "Team",
+    "status": "Status",
+    "dreamteam_count": "No. Dream Team Entry",
+    "in_dreamteam": "Dream Team Last GW?",
+    "ep_this": "xPoint Last GW",
+    "ep_next": "xPoint This GW",
+    "now_cost": "Price",
+    "ict_index": "ICT",
+    "influence": "Influence",
+    "creativity": "Creativity",
+    "threat": "Threat",
+    "points_per_game": "Points per Game",
+    "selected_by_percent": "Selected by (%)",
+}
+# Column order of the player table, derived columns included
+PLAYER_COLUMNS = [
+    "Name",
+    "POS",
+    "Team",
+    "Status",
+    "Dream Team Last GW?",
+    "No. Dream Team Entry",
+    "xPoint Last GW",
+    "xPoint This GW",
+    "Price",
+    "Price Change",
+    "xPoint/Price This GW",
+    "ICT",
+    "Influence",
+    "Creativity",
+    "Threat",
+    "Selected by (%)",
+    "Points per Game",
+    "form",
+    "cost_change_event",
+    "cost_change_start",
+]
+# Columns shown in the per-position tables
+PLAYER_DISPLAY_COLUMNS = [
+    column
+    for column in PLAYER_COLUMNS
+    if column not in ("POS", "Status", "cost_change_event", "cost_change_start")
+]
+
+# Price Change categories, coded by direction + 1, i.e. -1 -> 0, 0 -> 1, 1 -> 2
+PRICE_CHANGE_LABELS = ["⬇️", "--", "⬆️"]
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Get a shared HTTP/2 client so connections are reused across fetches.
+
+    Returns:
+        httpx.Client: shared client
+    """
+    return httpx.Client(http2=True, timeout=10.0)
+
 
 @st.cache_data(ttl="6h")
 def get_official_stats() -> Dict:
@@ -34,117 +133,88 @@ def get_official_stats() -> Dict:
     Returns:
         Dict: official stats
     """
-    response = httpx.get(STATIC_DATA_URL)
+    response = get_http_client().get(STATIC_DATA_URL)
     response.raise_for_status()
-    return response.json()
-
+    return orjson.loads(response.content)
 
-# @st.cache_data(ttl="6h")
-def parse_official_stats() -> None:
 
-    response = get_official_stats()
-    teams = [Team.model_validate(team) for team in response["teams"]]
-    players = [Player.model_validate(player) for player in response["elements"]]
-    events = [Event.model_validate(event) for event in response["events"]]
-    positions = [
-        Position.model_validate(position) for position in response["element_types"]
-    ]
-    st.session_state["teams"] = TeamList(teams=teams)
-    st.session_state["players"] = PlayerList(players=players)
-    st.session_state["events"] = EventList(events=events)
-    st.session_state["positions"] = PositionList(positions=positions)
+def preprocess_players_df(
+    df: pd.DataFrame, team_list: TeamList, pos_list: PositionList
+) -> pd.DataFrame:
+    """Turn raw player records into the player table shown in the app.
 
+    Args:
+        df (pd.DataFrame): raw player records restricted to `PLAYER_FIELDS`
+        team_list (TeamList): teams used to resolve team ids
+        pos_list (PositionList): positions used to resolve position ids
 
-def main() -> None:  # pylint: disable=too-many-locals
-    """Render webapp."""
-    st.title("FPL Stats")
+    Returns:
+        pd.DataFrame: player table sorted by xPoint per price
+    """
+    df = df.astype(PLAYER_FIELD_DTYPES).rename(columns=PLAYER_COLUMN_RENAME_MAPPING)
+    price = df["Price"].to_numpy() / 10  # FPL treat price as int
+    df["Price"] = price
+    # Resolve ids by renaming the handful of categories, not every row
+    df["Team"] = df["Team"].cat.rename_categories(team_list.id_to_name)
+    df["POS"] = df["POS"].cat.rename_categories(pos_list.id_to_singular_name)
 
-    parse_official_stats()
-
-    pos_names: List[str] = st.session_state["positions"].singular_names
-    team_names: List[str] = st.session_state["teams"].team_names
-    team_list: TeamList = st.session_state["teams"]
-    pos_list: PositionList = st.session_state["positions"]
-    df_all_players: pd.DataFrame = st.session_state["players"].to_dataframe(
-        include_fields=[
-            "web_name",
-            "element_type",
-            "team",
-            "status",
-            "in_dreamteam",
-            "dreamteam_count",
-            "ep_this",
-            "ep_next",
-            "now_cost",
-            "ict_index",
-            "influence",
-            "creativity",
-            "threat",
-            "selected_by_percent",
-            "points_per_game",
-            "form",
-            "cost_change_event",
-            "cost_change_start",
-        ],
-        columna_rename_mapping={
-            "web_name": "Name",
-            "element_type": "POS",
-            "team": "Team",
-            "status": "Status",
-            "dreamteam_count": "No. Dream Team Entry",
-            "in_dreamteam": "Dream Team Last GW?",
-            "ep_this": "xPoint Last GW",
-            "ep_next": "xPoint This GW",
-            "now_cost": "Price",
-            "ict_index": "ICT",
-            "influence": "Influence",
-            "creativity": "Creativity",
-            "threat": "Threat",
-            "points_per_game": "Points per Game",
-            "selected_by_percent": "Selected by (%)",
-        },
+    price_change = np.sign(
+        np.sign(df["cost_change_event"].to_numpy())
+        + np.sign(df["cost_change_start"].to_numpy())
     )
-    df_all_players["Price"] /= 10  # FPL treat price as int
-    df_all_players["Team"] = df_all_players["Team"].apply(team_list.team_name_by_id)
-    df_all_players["POS"] = df_all_players["POS"].apply(
-        pos_list.position_singular_name_by_id
+    # Stored as 1-byte codes, the labels are only looked up when rendered
+    df["Price Change"] = pd.Categorical.from_codes(
+        price_change + 1, categories=PRICE_CHANGE_LABELS
     )
+    xpoint_per_price = df["xPoint This GW"].to_numpy() / price
+    df["xPoint/Price This GW"] = xpoint_per_price
 
-    df_all_players.insert(
-        9,
-        "Price Change",
-        (
-            df_all_players["cost_change_event"].apply(np.sign)
-            + df_all_players["cost_change_start"].apply(np.sign)
-        )
-        .apply(np.sign)
-        .map({-1: "⬇️", 0: "--", 1: "⬆️"}),
-    )
+    # Sort rows and lay out columns in a single take, sorting the negated
+    # values so the order is descending with any NaNs kept last
+    order = np.argsort(-xpoint_per_price, kind="stable")
+    return df.iloc[order, df.columns.get_indexer(PLAYER_COLUMNS)]
 
-    df_all_players.insert(
-        10,
-        "xPoint/Price This GW",
-        df_all_players["xPoint This GW"] / df_all_players["Price"],
-    )
-    df_all_players = df_all_players.sort_values(
-        by="xPoint/Price This GW", ascending=False
-    )
 
-    st.subheader(st.session_state["events"].current_event_name)
-    deadline_time: datetime = st.session_state["events"].current_event.deadline_time
+@st.cache_resource(ttl="6h")
+def parse_official_stats() -> Tuple[pd.DataFrame, TeamList, PositionList, EventList]:
+    """Parse official stats into the player table and lookup models.
 
-    tagger_component(
-        "Deadline:",
-        [
-            datetime.strftime(
-                deadline_time.astimezone(HK_TIMEZONE), "Hong Kong Time: %Y-%m-%d %H:%M"
-            ),
-            datetime.strftime(
-                deadline_time.astimezone(LDN_TIMEZONE), "London Time: %Y-%m-%d %H:%M"
-            ),
-        ],
+    The result is shared by every session without copying, so callers must
+    treat it as read-only.
+
+    Returns:
+        Tuple[pd.DataFrame, TeamList, PositionList, EventList]: player table,
+            teams, positions and events
+    """
+    response = get_official_stats()
+    # Validate each list in one pass through its container model
+    team_list = TeamList(teams=response["teams"])
+    pos_list = PositionList(positions=response["element_types"])
+    event_list = EventList(events=response["events"])
+    # Players are only ever consumed as a table, so skip per-player model
+    # validation and build the frame straight from the raw payload
+    df_all_players = preprocess_players_df(
+        pd.DataFrame(response["elements"], columns=PLAYER_FIELDS), team_list, pos_list
     )
+    return df_all_players, team_list, pos_list, event_list
+
+
+@st.fragment
+def render_player_tables(  # pylint: disable=too-many-locals
+    df_all_players: pd.DataFrame,
+    pos_names: Tuple[str, ...],
+    team_names: Tuple[str, ...],
+) -> None:
+    """Render the player filters and per-position tables.
+
+    Runs as a fragment, so interacting with the filters only reruns this
+    function rather than the whole script.
 
+    Args:
+        df_all_players (pd.DataFrame): preprocessed player table
+        pos_names (Tuple[str, ...]): position names to filter by
+        team_names (Tuple[str, ...]): team names to filter by
+    """
     position = st.multiselect(
         label="Position",
         options=pos_names,
@@ -159,42 +229,45 @@ def main() -> None:  # pylint: disable=too-many-locals
     unavailable = st.checkbox("Include Unavailable Player?", value=False)
     suspended = st.checkbox("Include Suspended Player?", value=False)
     doubt = st.checkbox("Include Player in Doubt?", value=False)
+    price = df_all_players["Price"].to_numpy()
+    price_min, price_max = float(price.min()), float(price.max())
     price_range = st.slider(
         "Price Range",
-        float(df_all_players["Price"].min()),
-        float(df_all_players["Price"].max()),
-        (
-            float(df_all_players["Price"].min()),
-            float(df_all_players["Price"].max()),
-        ),
+        price_min,
+        price_max,
+        (price_min, price_max),
         step=0.1,
         format="%.1f M",
     )
 
-    df_filtered = df_all_players[df_all_players["POS"].isin(position)]
-    df_filtered = df_filtered[df_filtered["Team"].isin(team)]
-
-    if not injured:
-        df_filtered = df_filtered[df_filtered["Status"] != "i"]
-
-    if not unavailable:
-        df_filtered = df_filtered[df_filtered["Status"] != "u"]
-
-    if not suspended:
-        df_filtered = df_filtered[df_filtered["Status"] != "s"]
-
-    if not doubt:
-        df_filtered = df_filtered[df_filtered["Status"] != "d"]
-
-    df_filtered = df_filtered[
-        (df_filtered["Price"] >= price_range[0])
-        & (df_filtered["Price"] <= price_range[1])
+    excluded_status = {
+        status
+        for status, included in (
+            ("i", injured),
+            ("u", unavailable),
+            ("s", suspended),
+            ("d", doubt),
+        )
+        if not included
+    }
+    # Combine the predicates as plain NumPy arrays to skip the index
+    # alignment pandas performs for every Series operator
+    df_filtered = df_all_players[
+        df_all_players["POS"].isin(position).to_numpy()
+        & df_all_players["Team"].isin(team).to_numpy()
+        & ~df_all_players["Status"].isin(excluded_status).to_numpy()
+        & (price >= price_range[0])
+        & (price <= price_range[1])
     ]
 
+    df_display = df_filtered[PLAYER_DISPLAY_COLUMNS]
+    df_filtered_by_pos = dict(
+        iter(df_display.groupby(df_filtered["POS"], observed=True, sort=False))
+    )
     tabs = st.tabs(position)
     for tab, pos in zip(tabs, position):
         with tab:
-            df_filtered_pos = df_filtered[df_filtered["POS"] == pos]
+            df_filtered_pos = df_filtered_by_pos.get(pos, df_display.iloc[:0])
             st.markdown(
                 f"""
                 ##### Summary Statistics of {pos} that Fits the Selection Criteria
@@ -205,20 +278,39 @@ def main() -> None:  # pylint: disable=too-many-locals
                 """
             )
             st.dataframe(
-                df_filtered_pos.drop(
-                    [
-                        "POS",
-                        "Status",
-                        "cost_change_event",
-                        "cost_change_start",
-                    ],
-                    axis=1,
-                ),
+                df_filtered_pos,
                 hide_index=True,
                 use_container_width=True,
             )
 
 
+def main() -> None:
+    """Render webapp."""
+    st.title("FPL Stats")
+
+    df_all_players, team_list, pos_list, event_list = parse_official_stats()
+    pos_names: Tuple[str, ...] = pos_list.singular_names
+    team_names: Tuple[str, ...] = team_list.team_names
+
+    current_event = event_list.current_event
+    st.subheader(current_event.name)
+    deadline_time: datetime = current_event.deadline_time
+
+    tagger_component(
+        "Deadline:",
+        [
+            datetime.strftime(
+                deadline_time.astimezone(HK_TIMEZONE), "Hong Kong Time: %Y-%m-%d %H:%M"
+            ),
+            datetime.strftime(
+                deadline_time.astimezone(LDN_TIMEZONE), "London Time: %Y-%m-%d %H:%M"
+            ),
+        ],
+    )
+
+    render_player_tables(df_all_players, pos_names, team_names)
+
+
 if __name__ == "__main__":
     st.set_page_config(
         page_title="FPL Stats",
@@ -1,13 +1,33 @@
-import yaml
+POS = ("GK", "DEF", "MID", "FWD")
 
-with open("constants.yaml", "r") as f:
-    constants = yaml.safe_load(f)
+TEAMS = (
+    "ARS",
+    "AVL",
+    "BOU",
+    "BRE",
+    "BHA",
+    "BUR",
+    "CHE",
+    "CRY",
+    "EVE",
+    "FUL",
+    "LIV",
+    "LUT",
+    "MCI",
+    "MUN",
+    "NEW",
+    "NFO",
+    "SHU",
+    "TOT",
+    "WHU",
+    "WOL",
+)
 
-POS_ID_TO_NAME = {k + 1: v for k, v in enumerate(constants["pos"])}
-POS_NAME_TO_ID = {v: k + 1 for k, v in enumerate(constants["pos"])}
+POS_ID_TO_NAME = {k + 1: v for k, v in enumerate(POS)}
+POS_NAME_TO_ID = {v: k + 1 for k, v in enumerate(POS)}
 
-TEAMS_ID_TO_NAME = {k + 1: v for k, v in enumerate(constants["teams"])}
-TEAMS_NAME_TO_ID = {v: k + 1 for k, v in enumerate(constants["teams"])}
+TEAMS_ID_TO_NAME = {k + 1: v for k, v in enumerate(TEAMS)}
+TEAMS_NAME_TO_ID = {v: k + 1 for k, v in enumerate(TEAMS)}
 
 TEAM_FULL_NAME_TO_ABBR = {
     "Arsenal": "ARS",
@@ -1,16 +1,22 @@
+import sys
 from datetime import datetime
-from pydantic import BaseModel
-from typing import List, Optional, Any, Dict
-import pytz
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import List, Optional, Dict, Tuple
+import numpy as np
 import pandas as pd
 
 
-class Label(BaseModel):
+class FrozenModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+
+class Label(FrozenModel):
     label: str
     name: str
 
 
-class Position(BaseModel):
+class Position(FrozenModel):
     id: int
     plural_name: str
     singular_name: str
@@ -21,31 +27,33 @@ class Position(BaseModel):
     element_count: int
 
 
-class PositionList(BaseModel):
+class PositionList(FrozenModel):
     positions: List[Position]
 
-    @property
-    def singular_names(self) -> List[str]:
-        return [position.singular_name for position in self.positions]
+    @cached_property
+    def singular_names(self) -> Tuple[str, ...]:
+        return tuple(position.singular_name for position in self.positions)
 
-    @property
-    def plural_names(self) -> List[str]:
-        return [position.plural_name for position in self.positions]
+    @cached_property
+    def plural_names(self) -> Tuple[str, ...]:
+        return tuple(position.plural_name for position in self.positions)
+
+    @cached_property
+    def id_to_singular_name(self) -> Dict[int, str]:
+        return {position.id: position.singular_name for position in self.positions}
+
+    @cached_property
+    def id_to_plural_name(self) -> Dict[int, str]:
+        return {position.id: position.plural_name for position in self.positions}
 
     def position_singular_name_by_id(self, position_id: int) -> Optional[str]:
-        for pos in self.positions:
-            if pos.id == position_id:
-                return pos.singular_name
-        return None
+        return self.id_to_singular_name.get(position_id)
 
     def position_plural_name_by_id(self, position_id: int) -> Optional[str]:
-        for pos in self.positions:
-            if pos.id == position_id:
-                return pos.plural_name
-        return None
+        return self.id_to_plural_name.get(position_id)
 
 
-class Fixture(BaseModel):
+class Fixture(FrozenModel):
     id: int
     event: int
     team_a: int
@@ -56,111 +64,58 @@ class Fixture(BaseModel):
     finished: bool
 
 
-class Player(BaseModel):
-    assists: int
-    bonus: int
-    bps: int
-    chance_of_playing_next_round: Optional[float]
-    chance_of_playing_this_round: Optional[float]
-    clean_sheets: int
-    clean_sheets_per_90: float
+class Player(FrozenModel):
+    chance_of_playing_next_round: Optional[int]
+    chance_of_playing_this_round: Optional[int]
     code: int
-    corners_and_indirect_freekicks_order: Optional[float]
-    corners_and_indirect_freekicks_text: str
     cost_change_event: int
-    cost_change_event_fall: int
     cost_change_start: int
-    cost_change_start_fall: int
     creativity: float
-    creativity_rank: int
-    creativity_rank_type: int
-    direct_freekicks_order: Optional[float]
-    direct_freekicks_text: str
     dreamteam_count: int
     element_type: int
     ep_next: float
     ep_this: Optional[float]
-    event_points: int
-    expected_assists: float
-    expected_assists_per_90: float
-    expected_goal_involvements: float
-    expected_goal_involvements_per_90: float
-    expected_goals: float
-    expected_goals_conceded: float
-    expected_goals_conceded_per_90: float
-    expected_goals_per_90: float
     first_name: str
     form: float
-    form_rank: int
-    form_rank_type: int
-    goals_conceded: int
-    goals_conceded_per_90: float
-    goals_scored: int
     ict_index: float
-    ict_index_rank: int
-    ict_index_rank_type: int
     id: int
     in_dreamteam: bool
     influence: float
-    influence_rank: int
-    influence_rank_type: int
-    minutes: int
     news: str
-    news_added: Optional[Any]
+    news_added: Optional[datetime]
     now_cost: int
-    now_cost_rank: int
-    now_cost_rank_type: int
-    own_goals: int
-    penalties_missed: int
-    penalties_order: Optional[float]
-    penalties_saved: int
-    penalties_text: str
     photo: str
     points_per_game: float
-    points_per_game_rank: int
-    points_per_game_rank_type: int
-    red_cards: int
-    saves: int
-    saves_per_90: float
     second_name: str
     selected_by_percent: float
-    selected_rank: int
-    selected_rank_type: int
-    special: bool
-    squad_number: Optional[int]
-    starts: int
-    starts_per_90: float
     status: str
     team: int
-    team_code: int
     threat: float
-    threat_rank: int
-    threat_rank_type: int
     total_points: int
-    transfers_in: int
-    transfers_in_event: int
-    transfers_out: int
-    transfers_out_event: int
-    value_form: float
-    value_season: float
     web_name: str
-    yellow_cards: int
+
+    @field_validator("status", "news")
+    @classmethod
+    def intern_repeated_strings(cls, value: str) -> str:
+        return sys.intern(value)
 
 
-class PlayerList(BaseModel):
+class PlayerList(FrozenModel):
     players: List[Player]
 
+    @cached_property
+    def id_to_name(self) -> Dict[int, str]:
+        return {player.id: player.web_name for player in self.players}
+
+    @cached_property
+    def id_to_photo(self) -> Dict[int, str]:
+        return {player.id: player.photo for player in self.players}
+
     def player_name_by_id(self, player_id: int) -> Optional[str]:
-        for player in self.players:
-            if player.id == player_id:
-                return player.web_name
-        return None
+        return self.id_to_name.get(player_id)
 
     def player_photo_by_id(self, player_id: int) -> Optional[str]:
-        for player in self.players:
-            if player.id == player_id:
-                return player.photo
-        return None
+        return self.id_to_photo.get(player_id)
 
     def to_dataframe(
         self,
@@ -169,13 +124,28 @@ class PlayerList(BaseModel):
     ) -> pd.DataFrame:
         columna_rename_mapping = columna_rename_mapping or {}
         return pd.DataFrame(
-            [player.model_dump(include=set(include_fields)) for player in self.players]
-        )[include_fields].rename(columns=columna_rename_mapping)
+            {
+                columna_rename_mapping.get(field, field): [
+                    getattr(player, field) for player in self.players
+                ]
+                for field in include_fields
+            }
+        )
 
 
-class Event(BaseModel):
+class ChipPlay(FrozenModel):
+    chip_name: str
+    num_played: int
+
+
+class TopElementInfo(FrozenModel):
+    id: int
+    points: int
+
+
+class Event(FrozenModel):
     average_entry_score: float
-    chip_plays: List[Any]
+    chip_plays: List[ChipPlay]
     cup_leagues_created: bool
     data_checked: bool
     deadline_time: datetime
@@ -184,35 +154,54 @@ class Event(BaseModel):
     finished: bool
     h2h_ko_matches_created: bool
     highest_score: Optional[float]
-    highest_scoring_entry: Optional[Any]
+    highest_scoring_entry: Optional[int]
     id: int
     is_current: bool
     is_next: bool
     is_previous: bool
-    most_captained: Optional[Any]
-    most_selected: Optional[Any]
-    most_transferred_in: Optional[Any]
-    most_vice_captained: Optional[Any]
+    most_captained: Optional[int]
+    most_selected: Optional[int]
+    most_transferred_in: Optional[int]
+    most_vice_captained: Optional[int]
     name: str
     ranked_count: int
     release_time: Optional[datetime]
-    top_element: Optional[Any]
-    top_element_info: Optional[Any]
+    top_element: Optional[int]
+    top_element_info: Optional[TopElementInfo]
     transfers_made: int
 
 
-class EventList(BaseModel):
+class EventList(FrozenModel):
     events: List[Event]
 
+    @cached_property
+    def _events_sorted(self) -> List[Event]:
+        return sorted(self.events, key=lambda x: x.id)
+
+    @cached_property
+    def _deadlines(self) -> np.ndarray:
+        return np.array(
+            [event.deadline_time_epoch for event in self._events_sorted],
+            dtype="datetime64[s]",
+        )
+
+    @cached_property
+    def _flagged_next_event(self) -> Optional[Event]:
+        return next((event for event in self.events if event.is_next), None)
+
     @property
     def current_event(self) -> Optional[Event]:
-        today = datetime.now(pytz.utc)
-        filtered_event = [event for event in self.events if event.deadline_time > today]
-        if filtered_event:
-            return min(
-                (event for event in self.events if event.deadline_time > today),
-                key=lambda x: x.id,
-            )
+        # Not cached: the list outlives a gameweek deadline in the shared cache.
+        # Trust FPL's is_next flag while its deadline is still ahead; once it
+        # passes, deadlines increase with the gameweek id, so take the first
+        # open one.
+        now = np.datetime64("now", "s")
+        flagged = self._flagged_next_event
+        if flagged and np.datetime64(flagged.deadline_time_epoch, "s") > now:
+            return flagged
+        is_open = self._deadlines > now
+        if is_open.any():
+            return self._events_sorted[is_open.argmax()]
         return None
 
     @property
@@ -230,10 +219,9 @@ class EventList(BaseModel):
         return None
 
 
-class Team(BaseModel):
+class Team(FrozenModel):
     code: int
     draw: int
-    form: Optional[Any]
     id: int
     loss: int
     name: str
@@ -242,7 +230,6 @@ class Team(BaseModel):
     position: int
     short_name: str
     strength: int
-    team_division: Optional[Any]
     unavailable: bool
     win: int
     strength_overall_home: int
@@ -254,15 +241,16 @@ class Team(BaseModel):
     pulse_id: int
 
 
-class TeamList(BaseModel):
+class TeamList(FrozenModel):
     teams: List[Team]
 
-    @property
-    def team_names(self) -> List[str]:
-        return [team.name for team in self.teams]
+    @cached_property
+    def team_names(self) -> Tuple[str, ...]:
+        return tuple(team.name for team in self.teams)
+
+    @cached_property
+    def id_to_name(self) -> Dict[int, str]:
+        return {team.id: team.name for team in self.teams}
 
     def team_name_by_id(self, team_id: int) -> Optional[str]:
-        for team in self.teams:
-            if team.id == team_id:
-                return team.name
-        return None
+        return self.id_to_name.get(team_id)